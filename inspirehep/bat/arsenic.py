@@ -53,12 +53,16 @@ class Arsenic(object):
         return field.get_attribute('value')
 
     def hide_title_bar(self):
-        self._instance.execute_script('document.getElementById("collections-section").style.display = "none"')
-        self._instance.execute_script('document.getElementById("topnav").style.display = "none"')
+        self._instance.execute_script(
+            'document.getElementById("collections-section").style.display = "none";'
+            'document.getElementById("topnav").style.display = "none";'
+        )
 
     def show_title_bar(self):
-        self._instance.execute_script('document.getElementById("collections-section").style.display = ""')
-        self._instance.execute_script('document.getElementById("topnav").style.display = ""')
+        self._instance.execute_script(
+            'document.getElementById("collections-section").style.display = "";'
+            'document.getElementById("topnav").style.display = "";'
+        )
 
     def click_with_coordinates(self, element_id, x, y):
         el = self._instance.find_element_by_id(element_id)
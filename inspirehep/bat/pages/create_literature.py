@@ -24,10 +24,7 @@ from __future__ import absolute_import, division, print_function
 
 import os
 
-from selenium.common.exceptions import (
-    ElementNotVisibleException,
-    WebDriverException,
-)
+from selenium.common.exceptions import ElementNotVisibleException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -36,299 +33,247 @@ from ..arsenic import Arsenic, ArsenicResponse
 from ..EC import TryClick
 
 
+_SUBMISSION_TEXT = (
+    'The INSPIRE staff will review it and your changes will be added to '
+    'INSPIRE.'
+)
+_SUCCESS_ALERT = (
+    By.XPATH, '(//div[@class="alert alert-success alert-form-success"])'
+)
+_WARNING_ALERT = (
+    By.XPATH, '(//div[@class="alert alert-warning alert-form-warning"])'
+)
+_SUBMIT_BUTTON = (
+    By.CSS_SELECTOR,
+    '#webdeposit_form_accordion > div:nth-of-type(4) > span > button',
+)
+
+_ACCEPT_DATA = (By.ID, 'acceptData')
+_ADD_AUTHOR = (By.LINK_TEXT, 'Add another author')
+_ADD_REPORT_NUMBER = (By.LINK_TEXT, 'Add another report number')
+_ARXIV_ID = (By.ID, 'arxiv_id')
+_BOOK_TITLE = (By.ID, 'book_title')
+_CONF_NAME = (By.ID, 'conf_name')
+_DEFENSE_DATE = (By.ID, 'defense_date')
+_DEGREE_TYPE = (By.ID, 'degree_type')
+_DOI = (By.ID, 'doi')
+_END_PAGE = (By.ID, 'end_page')
+_EXTRA_COMMENTS = (By.ID, 'extra_comments')
+_IMPORT_DATA = (By.ID, 'importData')
+_INSTITUTION = (By.ID, 'institution')
+_ISSUE = (By.ID, 'issue')
+_JOURNAL_TITLE = (By.ID, 'journal_title')
+_LANGUAGE = (By.ID, 'language')
+_NONPUBLIC_NOTE = (By.ID, 'nonpublic_note')
+_PAGE_RANGE_ARTICLE_ID = (By.ID, 'page_range_article_id')
+_PUBLICATION_DATE = (By.ID, 'publication_date')
+_PUBLICATION_PLACE = (By.ID, 'publication_place')
+_PUBLISHER_NAME = (By.ID, 'publisher_name')
+_REFERENCES = (By.ID, 'references')
+_SERIES_TITLE = (By.ID, 'series_title')
+_SERIES_VOLUME = (By.ID, 'series_volume')
+_SKIP_IMPORT_DATA = (By.ID, 'skipImportData')
+_START_PAGE = (By.ID, 'start_page')
+_SUPERVISOR_AFFILIATION = (By.ID, 'supervisors-0-affiliation')
+_SUPERVISOR_NAME = (By.ID, 'supervisors-0-name')
+_THESIS_DATE = (By.ID, 'thesis_date')
+_TYPE_OF_DOC = (By.ID, 'type_of_doc')
+_TYPE_OF_DOC_LABEL = (By.CSS_SELECTOR, 'label[for="type_of_doc"]')
+_URL = (By.ID, 'url')
+_VOLUME = (By.ID, 'volume')
+_YEAR = (By.ID, 'year')
+
+
 def go_to():
     Arsenic().get(os.environ['SERVER_NAME'] + '/literature/new')
+    Arsenic().hide_title_bar()
 
 
 def submit_thesis(input_data):
-    def _submit_thesis():
-        return (
-            'The INSPIRE staff will review it and your changes will be added '
-            'to INSPIRE.'
-        ) in WebDriverWait(Arsenic(), 10).until(
-            EC.visibility_of_element_located(
-                (
-                    By.XPATH,
-                    '(//div[@class="alert alert-success alert-form-success"])',
-                )
-            )
-        ).text
-
     _skip_import_data()
-    Arsenic().hide_title_bar()
     _select_thesis()
     _links_population(input_data)
     _basic_info_population(input_data)
     _thesis_info_population(input_data)
     _references_comment_population(input_data)
-    Arsenic().find_element_by_xpath(
-        '//div[@id="webdeposit_form_accordion"]/div[4]/span/button'
-    ).click()
-    Arsenic().show_title_bar()
+    Arsenic().find_element(*_SUBMIT_BUTTON).click()
 
-    return ArsenicResponse(_submit_thesis)
+    return ArsenicResponse(lambda: _has_submission_alert(_SUCCESS_ALERT))
 
 
 def submit_book(input_data):
-    def _submit_book():
-        return (
-            'The INSPIRE staff will review it and your changes will be added '
-            'to INSPIRE.'
-        ) in WebDriverWait(Arsenic(), 10).until(
-            EC.visibility_of_element_located(
-                (
-                    By.XPATH,
-                    '(//div[@class="alert alert-success alert-form-success"])',
-                )
-            )
-        ).text
-
     _skip_import_data()
-    Arsenic().hide_title_bar()
     _select_book()
     _links_population(input_data)
     _basic_info_population(input_data)
     _book_info_population(input_data)
     _references_comment_population(input_data)
-    Arsenic().find_element_by_xpath(
-        '//div[@id="webdeposit_form_accordion"]/div[4]/span/button'
-    ).click()
-    Arsenic().show_title_bar()
+    Arsenic().find_element(*_SUBMIT_BUTTON).click()
 
-    return ArsenicResponse(_submit_book)
+    return ArsenicResponse(lambda: _has_submission_alert(_SUCCESS_ALERT))
 
 
 def submit_chapter(input_data):
-    def _submit_chapter():
-        return (
-            'The INSPIRE staff will review it and your changes will be added '
-            'to INSPIRE.'
-        ) in WebDriverWait(Arsenic(), 10).until(
-            EC.visibility_of_element_located(
-                (
-                    By.XPATH,
-                    '(//div[@class="alert alert-warning alert-form-warning"])',
-                )
-            )
-        ).text
-
     _skip_import_data()
-    Arsenic().hide_title_bar()
     _select_chapter()
     _links_population(input_data)
     _chapter_info_population(input_data)
     _basic_info_population(input_data)
     _references_comment_population(input_data)
-    Arsenic().find_element_by_xpath(
-        '//div[@id="webdeposit_form_accordion"]/div[4]/span/button'
-    ).click()
-    Arsenic().show_title_bar()
+    Arsenic().find_element(*_SUBMIT_BUTTON).click()
 
-    return ArsenicResponse(_submit_chapter)
+    return ArsenicResponse(lambda: _has_submission_alert(_WARNING_ALERT))
 
 
 def submit_journal_article_with_proceeding(input_data):
-    def _submit_journal_article_with_proceeding():
-        return (
-            'The INSPIRE staff will review it and your changes will be added '
-            'to INSPIRE.'
-        ) in WebDriverWait(Arsenic(), 10).until(
-            EC.visibility_of_element_located(
-                (
-                    By.XPATH,
-                    '(//div[@class="alert alert-success alert-form-success"])',
-                )
-            )
-        ).text
-
     _skip_import_data()
-    Arsenic().hide_title_bar()
     _links_population(input_data)
     _basic_info_population(input_data)
     _proceedings_population(input_data)
     _journal_conference_population(input_data)
     _references_comment_population(input_data)
-    Arsenic().find_element_by_xpath(
-        '//div[@id="webdeposit_form_accordion"]/div[4]/span/button'
-    ).click()
-    Arsenic().show_title_bar()
+    Arsenic().find_element(*_SUBMIT_BUTTON).click()
 
-    return ArsenicResponse(_submit_journal_article_with_proceeding)
+    return ArsenicResponse(lambda: _has_submission_alert(_SUCCESS_ALERT))
 
 
 def submit_journal_article(input_data):
-    def _submit_journal_article():
-        return (
-            'The INSPIRE staff will review it and your changes will be added '
-            'to INSPIRE.'
-        ) in WebDriverWait(Arsenic(), 10).until(
-            EC.visibility_of_element_located(
-                (
-                    By.XPATH,
-                    '(//div[@class="alert alert-success alert-form-success"])',
-                )
-            )
-        ).text
-
     _skip_import_data()
-    Arsenic().hide_title_bar()
     _links_population(input_data)
     _basic_info_population(input_data)
     _journal_conference_population(input_data)
     _references_comment_population(input_data)
-    Arsenic().find_element_by_xpath(
-        '//div[@id="webdeposit_form_accordion"]/div[4]/span/button'
-    ).click()
-    Arsenic().show_title_bar()
+    Arsenic().find_element(*_SUBMIT_BUTTON).click()
+
+    return ArsenicResponse(lambda: _has_submission_alert(_SUCCESS_ALERT))
+
 
-    return ArsenicResponse(_submit_journal_article)
+def _has_submission_alert(alert):
+    return _SUBMISSION_TEXT in WebDriverWait(Arsenic(), 10).until(
+        EC.visibility_of_element_located(alert)
+    ).text
 
 
 def _thesis_info_population(input_data):
-    WebDriverWait(Arsenic(), 10).until(
-        EC.visibility_of_element_located((By.ID, 'supervisors-0-name'))
-    )
-    Arsenic().find_element_by_id('supervisors-0-name').send_keys(
-        input_data['supervisor']
-    )
-    Arsenic().find_element_by_id('supervisors-0-affiliation').send_keys(
+    arsenic = Arsenic()
+    WebDriverWait(arsenic, 10).until(
+        EC.visibility_of_element_located(_SUPERVISOR_NAME)
+    ).send_keys(input_data['supervisor'])
+    arsenic.find_element(*_SUPERVISOR_AFFILIATION).send_keys(
         input_data['supervisor-affiliation']
     )
-    Arsenic().find_element_by_id('thesis_date').send_keys(
+    arsenic.find_element(*_THESIS_DATE).send_keys(
         input_data['thesis-date']
     )
-    Arsenic().find_element_by_id('defense_date').send_keys(
+    arsenic.find_element(*_DEFENSE_DATE).send_keys(
         input_data['defense-date']
     )
-    Select(Arsenic().find_element_by_id('degree_type')).select_by_value(
+    Select(arsenic.find_element(*_DEGREE_TYPE)).select_by_value(
         input_data['degree-type']
     )
-    Arsenic().find_element_by_id('institution').send_keys(
+    arsenic.find_element(*_INSTITUTION).send_keys(
         input_data['institution']
     )
 
 
 def _book_info_population(input_data):
-    WebDriverWait(Arsenic(), 10).until(
-        EC.visibility_of_element_located((By.ID, 'series_title'))
+    arsenic = Arsenic()
+    series_title = WebDriverWait(arsenic, 10).until(
+        EC.visibility_of_element_located(_SERIES_TITLE)
     )
-    Arsenic().find_element_by_id('publisher_name').send_keys(
+    arsenic.find_element(*_PUBLISHER_NAME).send_keys(
         input_data['publisher-name']
     )
-    Arsenic().find_element_by_id('publication_date').send_keys(
+    arsenic.find_element(*_PUBLICATION_DATE).send_keys(
         input_data['publication-date']
     )
-    Arsenic().find_element_by_id('publication_place').send_keys(
+    arsenic.find_element(*_PUBLICATION_PLACE).send_keys(
         input_data['publication-place']
     )
-    Arsenic().find_element_by_id('series_title').send_keys(
-        input_data['book-title']
-    )
-    Arsenic().find_element_by_id('series_volume').send_keys(
+    series_title.send_keys(input_data['book-title'])
+    arsenic.find_element(*_SERIES_VOLUME).send_keys(
         input_data['book-volume']
     )
 
 
 def _chapter_info_population(input_data):
-    WebDriverWait(Arsenic(), 10).until(
-        EC.visibility_of_element_located((By.ID, 'book_title'))
-    )
-    Arsenic().find_element_by_id('book_title').send_keys(
-        input_data['book-title']
-    )
-    Arsenic().find_element_by_id('start_page').send_keys(
+    arsenic = Arsenic()
+    WebDriverWait(arsenic, 10).until(
+        EC.visibility_of_element_located(_BOOK_TITLE)
+    ).send_keys(input_data['book-title'])
+    arsenic.find_element(*_START_PAGE).send_keys(
         input_data['page-start']
     )
-    Arsenic().find_element_by_id('end_page').send_keys(
+    arsenic.find_element(*_END_PAGE).send_keys(
         input_data['page-end']
     )
 
 
 def _links_population(input_data):
-    Arsenic().find_element_by_id('url').send_keys(input_data['pdf-1'])
+    Arsenic().find_element(*_URL).send_keys(input_data['pdf-1'])
 
 
 def _basic_info_population(input_data):
-    Arsenic().find_element_by_id('title').send_keys(input_data['title'])
-    Select(Arsenic().find_element_by_id('language')).select_by_value(
+    arsenic = Arsenic()
+    Select(arsenic.find_element(*_LANGUAGE)).select_by_value(
         input_data['language']
     )
-    Arsenic().find_element_by_id('title_translation').send_keys(
-        input_data['title_translation']
-    )
-    Arsenic().find_element_by_xpath('(//button[@type="button"])[8]').click()
-    Arsenic().find_element_by_css_selector('input[type=\"checkbox\"]').click()
-    Arsenic().find_element_by_xpath(
-        '//input[@value="' + input_data['subject'] + '"]'
-    ).click()
-    Arsenic().find_element_by_xpath('(//button[@type="button"])[8]').click()
-    Arsenic().find_element_by_id('authors-0-name').send_keys(
-        input_data['author-0']
-    )
-    Arsenic().find_element_by_id('authors-0-affiliation').send_keys(
-        input_data['author-0-affiliation']
-    )
-    Arsenic().find_element_by_link_text('Add another author').click()
-    Arsenic().find_element_by_id('authors-1-name').send_keys(
-        input_data['author-1']
-    )
-    Arsenic().find_element_by_id('authors-1-affiliation').send_keys(
-        input_data['author-1-affiliation']
-    )
-
-    try:
-        Arsenic().find_element_by_id('collaboration').send_keys(
-            input_data['collaboration']
-        )
-    except (ElementNotVisibleException, WebDriverException):
-        pass
-
-    Arsenic().find_element_by_id('experiment').send_keys(
-        input_data['experiment']
-    )
-    Arsenic().find_element_by_id('abstract').send_keys(input_data['abstract'])
-    Arsenic().find_element_by_id('report_numbers-0-report_number').send_keys(
-        input_data['report-number-0']
-    )
-    Arsenic().find_element_by_link_text('Add another report number').click()
-    Arsenic().find_element_by_id('report_numbers-1-report_number').send_keys(
-        input_data['report-number-1']
-    )
+    arsenic.execute_script(
+        """var toggle = document.querySelectorAll('button[type="button"]')[7];
+        toggle.click();
+        document.querySelector('input[type="checkbox"]').click();
+        document.querySelector('input[value="' + arguments[0] + '"]').click();
+        toggle.click();""",
+        input_data['subject'],
+    )
+    arsenic.find_element(*_ADD_AUTHOR).click()
+    arsenic.find_element(*_ADD_REPORT_NUMBER).click()
+    _set_field_values({
+        'title': input_data['title'],
+        'title_translation': input_data['title_translation'],
+        'authors-0-name': input_data['author-0'],
+        'authors-0-affiliation': input_data['author-0-affiliation'],
+        'authors-1-name': input_data['author-1'],
+        'authors-1-affiliation': input_data['author-1-affiliation'],
+        'collaboration': input_data['collaboration'],
+        'experiment': input_data['experiment'],
+        'abstract': input_data['abstract'],
+        'report_numbers-0-report_number': input_data['report-number-0'],
+        'report_numbers-1-report_number': input_data['report-number-1'],
+    }, optional=('collaboration',))
 
 
 def _journal_conference_population(input_data):
-    Arsenic().find_element_by_id('journal_title').send_keys(
+    arsenic = Arsenic()
+    arsenic.find_element(*_JOURNAL_TITLE).send_keys(
         input_data['journal_title']
     )
-    Arsenic().find_element_by_id('volume').send_keys(input_data['volume'])
-    Arsenic().find_element_by_id('issue').send_keys(input_data['issue'])
-    Arsenic().find_element_by_id('year').send_keys(input_data['year'])
-    Arsenic().find_element_by_id('page_range_article_id').send_keys(
+    arsenic.find_element(*_VOLUME).send_keys(input_data['volume'])
+    arsenic.find_element(*_ISSUE).send_keys(input_data['issue'])
+    arsenic.find_element(*_YEAR).send_keys(input_data['year'])
+    arsenic.find_element(*_PAGE_RANGE_ARTICLE_ID).send_keys(
         input_data['page-range-article']
     )
 
-    WebDriverWait(Arsenic(), 10).until(
-        EC.visibility_of_element_located(
-            (By.ID, 'conf_name'))).send_keys(input_data['conf-name'])
+    WebDriverWait(arsenic, 10).until(
+        EC.visibility_of_element_located(_CONF_NAME)
+    ).send_keys(input_data['conf-name'])
 
 
 def _proceedings_population(input_data):
     WebDriverWait(Arsenic(), 10).until(
-        EC.visibility_of_element_located(
-            (By.ID, 'nonpublic_note')
-        )
+        EC.visibility_of_element_located(_NONPUBLIC_NOTE)
     ).send_keys(input_data['non-public-note'])
 
 
 def _references_comment_population(input_data):
-    WebDriverWait(Arsenic(), 10).until(
-        EC.visibility_of_element_located(
-            (By.ID, 'references')
-        )
+    arsenic = Arsenic()
+    WebDriverWait(arsenic, 10).until(
+        EC.visibility_of_element_located(_REFERENCES)
     ).send_keys(input_data['references'])
 
-    WebDriverWait(Arsenic(), 10).until(
-        EC.visibility_of_element_located((By.ID, 'extra_comments'))
+    WebDriverWait(arsenic, 10).until(
+        EC.visibility_of_element_located(_EXTRA_COMMENTS)
     ).send_keys(input_data['extra-comments'])
 
 
@@ -340,7 +285,7 @@ def write_institution_thesis(institution, expected_data):
     _skip_import_data()
     _select_thesis()
     WebDriverWait(Arsenic(), 5).until(
-        EC.visibility_of_element_located((By.ID, 'supervisors-0-affiliation'))
+        EC.visibility_of_element_located(_SUPERVISOR_AFFILIATION)
     )
     return ArsenicResponse(_write_institution_thesis)
 
@@ -376,39 +321,33 @@ def submit_arxiv_id(arxiv_id, expected_data):
     def _submit_arxiv_id():
         return expected_data == output_data
 
-    Arsenic().find_element_by_id('arxiv_id').send_keys(arxiv_id)
-    WebDriverWait(Arsenic(), 10).until(
-        EC.visibility_of_element_located((By.ID, 'importData'))
+    arsenic = Arsenic()
+    arsenic.find_element(*_ARXIV_ID).send_keys(arxiv_id)
+    WebDriverWait(arsenic, 10).until(
+        EC.visibility_of_element_located(_IMPORT_DATA)
     ).click()
-    WebDriverWait(Arsenic(), 20).until(
-        EC.visibility_of_element_located((By.ID, 'acceptData'))
+    WebDriverWait(arsenic, 20).until(
+        EC.visibility_of_element_located(_ACCEPT_DATA)
     ).click()
-    WebDriverWait(Arsenic(), 20).until(
-        EC.visibility_of_element_located((By.ID, 'arxiv_id'))
+    WebDriverWait(arsenic, 20).until(
+        EC.visibility_of_element_located(_ARXIV_ID)
     )
     _skip_import_data()
 
-    output_data = {
-        'doi': Arsenic().find_element_by_id('doi').get_attribute('value'),
-        'year': Arsenic().find_element_by_id('year').get_attribute('value'),
-        'issue': Arsenic().find_element_by_id('issue').get_attribute('value'),
-        'title': Arsenic().find_element_by_id('title').get_attribute('value'),
-        'volume': Arsenic().find_element_by_id('volume').get_attribute(
-            'value'
-        ),
-        'abstract': Arsenic().find_element_by_id('abstract').get_attribute(
-            'value'
-        ),
-        'author': Arsenic().find_element_by_id('authors-0-name').get_attribute(
-            'value'
-        ),
-        'journal': Arsenic().find_element_by_id('journal_title').get_attribute(
-            'value'
-        ),
-        'page-range': Arsenic().find_element_by_id(
-            'page_range_article_id'
-        ).get_attribute('value')
-    }
+    output_data = _get_field_values({
+        'doi': 'doi',
+        'year': 'year',
+        'issue': 'issue',
+        'title': 'title',
+        'volume': 'volume',
+        'abstract': 'abstract',
+        'author': 'authors-0-name',
+        'journal': 'journal_title',
+        'page-range': 'page_range_article_id',
+    })
+    # The import is done through ajax, so the page is not reloaded and
+    # the title bar has to be restored explicitly.
+    arsenic.show_title_bar()
 
     return ArsenicResponse(_submit_arxiv_id)
 
@@ -417,106 +356,109 @@ def submit_doi_id(doi_id, expected_data):
     def _submit_doi_id():
         return expected_data == output_data
 
-    Arsenic().find_element_by_id('doi').send_keys(doi_id)
-    Arsenic().find_element_by_id('importData').click()
-    WebDriverWait(Arsenic(), 20).until(
-        EC.visibility_of_element_located((By.ID, 'acceptData'))
+    arsenic = Arsenic()
+    arsenic.find_element(*_DOI).send_keys(doi_id)
+    arsenic.find_element(*_IMPORT_DATA).click()
+    WebDriverWait(arsenic, 20).until(
+        EC.visibility_of_element_located(_ACCEPT_DATA)
     ).click()
-    WebDriverWait(Arsenic(), 20).until(
-        EC.visibility_of_element_located((By.ID, 'doi'))
+    WebDriverWait(arsenic, 20).until(
+        EC.visibility_of_element_located(_DOI)
     )
     _skip_import_data()
 
-    output_data = {
-        'year': Arsenic().find_element_by_id('year').get_attribute('value'),
-        'title': Arsenic().find_element_by_id('title').get_attribute('value'),
-        'issue': Arsenic().find_element_by_id('issue').get_attribute('value'),
-        'volume': Arsenic().find_element_by_id('volume').get_attribute(
-            'value'
-        ),
-        'journal': Arsenic().find_element_by_id('journal_title').get_attribute(
-            'value'
-        ),
-        'author': Arsenic().find_element_by_id('authors-0-name').get_attribute(
-            'value'
-        ),
-        'author-1': Arsenic().find_element_by_id(
-            'authors-1-name'
-        ).get_attribute('value'),
-        'author-2': Arsenic().find_element_by_id(
-            'authors-2-name'
-        ).get_attribute('value'),
-        'page-range': Arsenic().find_element_by_id(
-            'page_range_article_id'
-        ).get_attribute('value')
-    }
+    output_data = _get_field_values({
+        'year': 'year',
+        'title': 'title',
+        'issue': 'issue',
+        'volume': 'volume',
+        'journal': 'journal_title',
+        'author': 'authors-0-name',
+        'author-1': 'authors-1-name',
+        'author-2': 'authors-2-name',
+        'page-range': 'page_range_article_id',
+    })
+    arsenic.show_title_bar()
 
     return ArsenicResponse(_submit_doi_id)
 
 
+def _get_field_values(fields):
+    return Arsenic().execute_script(
+        """var fields = arguments[0];
+        var values = {};
+        for (var key in fields) {
+            var field = document.getElementById(fields[key]);
+            values[key] = field ? field.value : null;
+        }
+        return values;""",
+        fields,
+    )
+
+
+def _set_field_values(values, optional=()):
+    """Fill several form fields in a single script call.
+
+    Raises if one of the fields is missing or hidden, unless its id is listed
+    in ``optional``.
+    """
+    unset = Arsenic().execute_script(
+        """var values = arguments[0];
+        var unset = [];
+        for (var id in values) {
+            var field = document.getElementById(id);
+            if (!field || field.offsetParent === null) {
+                unset.push(id);
+                continue;
+            }
+            field.value = values[id];
+            field.dispatchEvent(new Event('input', {bubbles: true}));
+            field.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        return unset;""",
+        values,
+    )
+
+    missing = sorted(set(unset) - set(optional))
+    if missing:
+        raise ElementNotVisibleException(
+            'Could not fill the fields: {}'.format(', '.join(missing)))
+
+
 def _skip_import_data():
-    Arsenic().hide_title_bar()
-    WebDriverWait(Arsenic(), 10).until(
-        TryClick((By.ID, 'skipImportData'))
+    arsenic = Arsenic()
+    WebDriverWait(arsenic, 10).until(
+        TryClick(_SKIP_IMPORT_DATA)
     ).click()
-    WebDriverWait(Arsenic(), 10).until(
-        EC.text_to_be_present_in_element(
-            (By.ID, 'form_container'),
-            'Type of Document',
-        )
-    )
-    Arsenic().execute_script(
-        """document.evaluate(
-            "//div[@id='webdeposit_form_accordion']/div[3]/div[8]/div[1]",
-            document,
-            null,
-            XPathResult.FIRST_ORDERED_NODE_TYPE,
-            null
-        ).singleNodeValue.click()"""
-    )
-    Arsenic().execute_script(
-        """document.evaluate(
-            "//div[@id='webdeposit_form_accordion']/div[3]/div[9]/div[1]",
-            document,
-            null,
-            XPathResult.FIRST_ORDERED_NODE_TYPE,
-            null
-        ).singleNodeValue.click()"""
-    )
-    Arsenic().execute_script(
-        """document.evaluate(
-            "//div[@id='webdeposit_form_accordion']/div[3]/div[10]/div[1]",
-            document,
-            null,
-            XPathResult.FIRST_ORDERED_NODE_TYPE,
-            null
-        ).singleNodeValue.click()"""
+    WebDriverWait(arsenic, 10).until(
+        EC.visibility_of_element_located(_TYPE_OF_DOC_LABEL)
     )
-    Arsenic().execute_script(
-        """document.evaluate(
-            "//div[@id='webdeposit_form_accordion']/div[3]/div[11]/div[1]",
-            document,
-            null,
-            XPathResult.FIRST_ORDERED_NODE_TYPE,
-            null
-        ).singleNodeValue.click()"""
+    arsenic.execute_script(
+        """[8, 9, 10, 11].forEach(function(index) {
+            document.evaluate(
+                "//div[@id='webdeposit_form_accordion']/div[3]/div[" + index + "]/div[1]",
+                document,
+                null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE,
+                null
+            ).singleNodeValue.click();
+        });"""
     )
-    Arsenic().show_title_bar()
 
 
 def _select_thesis():
-    Select(Arsenic().find_element_by_id('type_of_doc')).select_by_value(
+    Select(Arsenic().find_element(*_TYPE_OF_DOC)).select_by_value(
         'thesis'
     )
 
 
 def _select_book():
-    Select(Arsenic().find_element_by_id('type_of_doc')).select_by_value(
+    Select(Arsenic().find_element(*_TYPE_OF_DOC)).select_by_value(
         'book'
     )
 
 
 def _select_chapter():
-    Select(Arsenic().find_element_by_id('type_of_doc')).select_by_value(
+    Select(Arsenic().find_element(*_TYPE_OF_DOC)).select_by_value(
         'chapter'
     )
@@ -1353,6 +1353,9 @@ INDEXER_DEFAULT_INDEX = "records-hep"
 INDEXER_DEFAULT_DOC_TYPE = "hep"
 INDEXER_REPLACE_REFS = False
 INDEXER_BULK_REQUEST_TIMEOUT = float(120)
+INDEXER_BULK_CHUNK_SIZE = 500
+INDEXER_BULK_THREAD_COUNT = 1
+INDEXER_BULK_ASYNC = False
 
 # OAuthclient
 # ===========
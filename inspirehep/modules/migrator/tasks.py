@@ -45,7 +45,6 @@ from six import text_type
 from dojson.contrib.marc21.utils import create_record as marc_create_record
 from invenio_collections import current_collections
 from invenio_db import db
-from invenio_indexer.api import RecordIndexer, current_record_to_index
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PersistentIdentifier
 from invenio_search import current_search_client as es
@@ -60,6 +59,7 @@ from inspirehep.modules.pidstore.minters import inspire_recid_minter
 from inspirehep.modules.pidstore.utils import get_pid_type_from_schema
 from inspirehep.modules.records.api import InspireRecord
 from inspirehep.modules.records.receivers import receive_after_model_commit
+from inspirehep.modules.records.utils import create_index_op
 
 from .models import InspireProdRecords
 
@@ -168,20 +168,6 @@ def continuous_migration():
         logger.info("Continuous_migration already executed. Skipping.")
 
 
-def create_index_op(record):
-    index, doc_type = current_record_to_index(record)
-
-    return {
-        '_op_type': 'index',
-        '_index': index,
-        '_type': doc_type,
-        '_id': str(record.id),
-        '_version': record.revision_id,
-        '_version_type': 'external_gte',
-        '_source': RecordIndexer._prepare_record(record, index, doc_type),
-    }
-
-
 @shared_task(ignore_result=False, compress='zlib', acks_late=True)
 def migrate_chunk(chunk):
     models_committed.disconnect(receive_after_model_commit)
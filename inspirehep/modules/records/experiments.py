@@ -22,6 +22,9 @@
 
 """Dictionary used when normalizing experiment names.
 
+Keys are stored already lowercased and stripped of spaces, so that a lookup
+only needs to normalize the experiment name it is given.
+
 FIXME: this is currently a static Python dictionary, but it should be replaced
 by a query on the dynamic state of the Experiments collection.
 """
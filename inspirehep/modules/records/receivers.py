@@ -26,69 +26,119 @@ from __future__ import absolute_import, division, print_function
 
 from itertools import chain
 
+from flask import current_app
 from flask_sqlalchemy import models_committed
 
-from invenio_indexer.api import RecordIndexer
 from invenio_indexer.signals import before_record_index
 from invenio_records.models import RecordMetadata
 
 from inspire_dojson.utils import get_recid_from_ref
 from inspire_utils.helpers import force_list
-from inspire_utils.record import get_value
 from inspirehep.modules.records.api import InspireRecord
+from inspirehep.modules.records.tasks import index_records
+from inspirehep.modules.records.utils import (
+    bulk_index,
+    create_delete_op,
+    create_index_op,
+)
 from inspirehep.utils.date import create_earliest_date
 
 from .experiments import EXPERIMENTS_MAP
 from .signals import after_record_enhanced
 
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+
 
 @models_committed.connect
 def receive_after_model_commit(sender, changes):
-    """Perform actions after models committed to database."""
-    indexer = RecordIndexer()
+    """Perform actions after models committed to database.
+
+    All the records touched by the commit are indexed or deleted from
+    Elasticsearch with a single bulk request. When ``INDEXER_BULK_ASYNC`` is
+    set, the request is sent from a Celery task instead.
+    """
+    index_async = current_app.config['INDEXER_BULK_ASYNC']
+
+    delete_ops = []
+    index_ops = []
+    uuids_to_index = []
     for model_instance, change in changes:
         if isinstance(model_instance, RecordMetadata):
-            if change in ('insert', 'update'):
-                indexer.index(InspireRecord(model_instance.json, model_instance))
+            if change not in ('insert', 'update'):
+                delete_ops.append(create_delete_op(model_instance))
+            elif index_async:
+                uuids_to_index.append(str(model_instance.id))
             else:
-                indexer.delete(InspireRecord(model_instance.json, model_instance))
+                record = InspireRecord(model_instance.json, model_instance)
+                index_ops.append(create_index_op(record))
+
+    if index_async:
+        if uuids_to_index or delete_ops:
+            index_records.delay(uuids_to_index, delete_ops)
+    elif index_ops or delete_ops:
+        bulk_index(index_ops + delete_ops)
 
 
 @before_record_index.connect
 def enhance_record(sender, json, *args, **kwargs):
     """Runs all the record enhancers and fires the after_record_enhanced signals
        to allow receivers work with a fully populated record."""
+    schema_name = _get_schema_name(json)
+
     populate_inspire_document_type(sender, json, *args, **kwargs)
     match_valid_experiments(sender, json, *args, **kwargs)
     populate_recid_from_ref(sender, json, *args, **kwargs)
-    populate_abstract_source_suggest(sender, json, *args, **kwargs)
-    populate_title_suggest(sender, json, *args, **kwargs)
-    populate_affiliation_suggest(sender, json, *args, **kwargs)
+    if schema_name == 'hep':
+        _populate_abstract_source_suggest(json)
+    elif schema_name == 'journals':
+        _populate_title_suggest(json)
+    elif schema_name == 'institutions':
+        _populate_affiliation_suggest(json)
     after_record_enhanced.send(json)
-    add_book_autocomplete(sender, json, *args, **kwargs)
+    if schema_name == 'hep':
+        add_book_autocomplete(sender, json, *args, **kwargs)
+
+
+def _get_schema_name(json):
+    """Return the name of the schema of a record, e.g. ``hep``."""
+    schema = json.get('$schema', '')
+    return schema.rsplit('/', 1)[-1].split('.', 1)[0]
+
+
+def _get_unique_values(values):
+    """Return the non-empty values without duplicates, keeping their order."""
+    seen = set()
+    result = []
+    for value in values:
+        if value and value not in seen:
+            seen.add(value)
+            result.append(value)
+
+    return result
 
 
 def add_book_autocomplete(sender, json, *args, **kwargs):
     if 'book' in json.get('document_type', []):
-        authors = force_list(get_value(json, 'authors.full_name'))
-        titles = force_list(get_value(json, 'titles.title'))
-
-        result = json.get('bookautocomplete', [])
-        result.extend(authors)
-        result.extend(titles)
-
-        ref = get_value(json, 'self.$ref')
-
-        json.update({
-            'bookautocomplete': {
-                'input': result,
-                'payload': {
-                    'authors': authors,
-                    'id': ref,
-                    'title': titles,
-                },
+        authors = [
+            author['full_name'] for author in json.get('authors', [])
+            if 'full_name' in author
+        ]
+        titles = [
+            title['title'] for title in json.get('titles', [])
+            if 'title' in title
+        ]
+
+        json['bookautocomplete'] = {
+            'input': _get_unique_values(chain(authors, titles)),
+            'payload': {
+                'authors': authors,
+                'id': json.get('self', {}).get('$ref'),
+                'title': titles,
             },
-        })
+        }
 
 
 def populate_inspire_document_type(sender, json, *args, **kwargs):
@@ -97,11 +147,8 @@ def populate_inspire_document_type(sender, json, *args, **kwargs):
     Adds the `facet_inspire_doc_type` key to the record, to be used for
     faceting in the search interface.
     """
-    result = []
-
-    result.extend(json.get('document_type', []))
-    result.extend(json.get('publication_type', []))
-    if 'refereed' in json and json['refereed']:
+    result = json.get('document_type', []) + json.get('publication_type', [])
+    if json.get('refereed'):
         result.append('peer reviewed')
 
     json['facet_inspire_doc_type'] = result
@@ -113,14 +160,6 @@ def match_valid_experiments(sender, json, *args, **kwargs):
     FIXME: this is currently using a static Python dictionary, while it should
     use the current dynamic state of the Experiments collection.
     """
-    def _normalize(experiment):
-        try:
-            result = EXPERIMENTS_MAP[experiment.lower().replace(' ', '')]
-        except KeyError:
-            result = experiment
-
-        return result
-
     if 'accelerator_experiments' in json:
         accelerator_exps = json['accelerator_experiments']
         for accelerator_exp in accelerator_exps:
@@ -128,11 +167,23 @@ def match_valid_experiments(sender, json, *args, **kwargs):
             if 'experiment' in accelerator_exp:
                 experiments = force_list(accelerator_exp['experiment'])
                 for experiment in experiments:
-                    normalized_experiment = _normalize(experiment)
+                    normalized_experiment = _normalize_experiment(experiment)
                     facet_experiment.append(normalized_experiment)
                 accelerator_exp['facet_experiment'] = [facet_experiment]
 
 
+@lru_cache(maxsize=4096)
+def _normalize_experiment(experiment):
+    return EXPERIMENTS_MAP.get(experiment.lower().replace(' ', ''), experiment)
+
+
+@lru_cache(maxsize=256)
+def _get_recid_key(key):
+    """Append '_recid' and remove 'record' from the key name."""
+    key_basename = key.replace('record', '').rstrip('_')
+    return '{}_recid'.format(key_basename).lstrip('_')
+
+
 def populate_recid_from_ref(sender, json, *args, **kwargs):
     """Extracts recids from all reference fields and adds them to ES.
 
@@ -168,125 +219,139 @@ def populate_recid_from_ref(sender, json, *args, **kwargs):
         'deleted_records': 'deleted_recids'
     }
 
-    def _recusive_find_refs(json_root):
+    stack = [json]
+    while stack:
+        json_root = stack.pop()
         if isinstance(json_root, list):
-            items = enumerate(json_root)
-        elif isinstance(json_root, dict):
+            stack.extend(
+                el for el in json_root if isinstance(el, (dict, list))
+            )
+        else:
             # Note that items have to be generated before altering the dict.
             # In this case, iteritems might break during iteration.
-            items = json_root.items()
-        else:
-            items = []
-
-        for key, value in items:
-            if (isinstance(json_root, dict) and isinstance(value, dict) and
-                    '$ref' in value):
-                # Append '_recid' and remove 'record' from the key name.
-                key_basename = key.replace('record', '').rstrip('_')
-                new_key = '{}_recid'.format(key_basename).lstrip('_')
-                json_root[new_key] = get_recid_from_ref(value)
-            elif (isinstance(json_root, dict) and isinstance(value, list) and
-                    key in list_ref_fields_translations):
-                new_list = [get_recid_from_ref(v) for v in value]
-                new_key = list_ref_fields_translations[key]
-                json_root[new_key] = new_list
-            else:
-                _recusive_find_refs(value)
-
-    _recusive_find_refs(json)
+            for key, value in json_root.items():
+                if isinstance(value, dict) and '$ref' in value:
+                    json_root[_get_recid_key(key)] = get_recid_from_ref(value)
+                elif (isinstance(value, list) and
+                        key in list_ref_fields_translations):
+                    new_list = [get_recid_from_ref(v) for v in value]
+                    new_key = list_ref_fields_translations[key]
+                    json_root[new_key] = new_list
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
 
 
 def populate_abstract_source_suggest(sender, json, *args, **kwargs):
     """Populate abstract_source_suggest field of HEP records."""
 
     # FIXME: Use a dedicated method when #1355 will be resolved.
-    if 'hep.json' in json.get('$schema'):
-        abstracts = json.get('abstracts', [])
-        for abstract in abstracts:
-            source = abstract.get('source')
-            if source:
-                abstract.update({
-                    'abstract_source_suggest': {
-                        'input': source,
-                        'output': source,
-                    },
-                })
+    if _get_schema_name(json) == 'hep':
+        _populate_abstract_source_suggest(json)
+
+
+def _populate_abstract_source_suggest(json):
+    abstracts = json.get('abstracts', [])
+    for abstract in abstracts:
+        source = abstract.get('source')
+        if source:
+            abstract.update({
+                'abstract_source_suggest': {
+                    'input': source,
+                    'output': source,
+                },
+            })
 
 
 def populate_title_suggest(sender, json, *args, **kwargs):
     """Populate title_suggest field of Journals records."""
-    if 'journals.json' in json.get('$schema'):
-        journal_title = get_value(json, 'journal_title.title', default='')
-        short_title = json.get('short_title', '')
-        title_variants = json.get('title_variants', [])
-
-        input_values = []
-        input_values.append(journal_title)
-        input_values.append(short_title)
-        input_values.extend(title_variants)
-        input_values = [el for el in input_values if el]
-
-        json.update({
-            'title_suggest': {
-                'input': input_values,
-                'output': short_title if short_title else '',
-                'payload': {
-                    'full_title': journal_title if journal_title else ''
-                }
+    if _get_schema_name(json) == 'journals':
+        _populate_title_suggest(json)
+
+
+def _populate_title_suggest(json):
+    journal_title = json.get('journal_title', {}).get('title', '')
+    short_title = json.get('short_title', '')
+    title_variants = json.get('title_variants', [])
+
+    input_values = _get_unique_values(
+        chain([journal_title, short_title], title_variants))
+
+    json.update({
+        'title_suggest': {
+            'input': input_values,
+            'output': short_title if short_title else '',
+            'payload': {
+                'full_title': journal_title if journal_title else ''
             }
-        })
+        }
+    })
 
 
 def populate_affiliation_suggest(sender, json, *args, **kwargs):
     """Populate the ``affiliation_suggest`` field of Institution records."""
 
     # FIXME: Use a dedicated method when #1355 will be resolved.
-    if 'institutions.json' in json.get('$schema'):
-        ICN = json.get('ICN', [])
-        institution_acronyms = get_value(json, 'institution_hierarchy.acronym', default=[])
-        institution_names = get_value(json, 'institution_hierarchy.name', default=[])
-        legacy_ICN = json.get('legacy_ICN', '')
-        name_variants = force_list(get_value(json, 'name_variants.value', default=[]))
-        postal_codes = force_list(get_value(json, 'addresses.postal_code', default=[]))
-
-        input_values = []
-        input_values.extend(ICN)
-        input_values.extend(institution_acronyms)
-        input_values.extend(institution_names)
-        input_values.append(legacy_ICN)
-        input_values.extend(name_variants)
-        input_values.extend(postal_codes)
-        input_values = [el for el in input_values if el]
-
-        json.update({
-            'affiliation_suggest': {
-                'input': input_values,
-                'output': legacy_ICN,
-                'payload': {
-                    '$ref': get_value(json, 'self.$ref'),
-                    'ICN': ICN,
-                    'institution_acronyms': institution_acronyms,
-                    'institution_names': institution_names,
-                    'legacy_ICN': legacy_ICN,
-                },
+    if _get_schema_name(json) == 'institutions':
+        _populate_affiliation_suggest(json)
+
+
+def _populate_affiliation_suggest(json):
+    ICN = json.get('ICN', [])
+    institution_hierarchy = json.get('institution_hierarchy', [])
+    institution_acronyms = [
+        el['acronym'] for el in institution_hierarchy if 'acronym' in el
+    ]
+    institution_names = [
+        el['name'] for el in institution_hierarchy if 'name' in el
+    ]
+    legacy_ICN = json.get('legacy_ICN', '')
+    name_variants = [
+        el['value'] for el in json.get('name_variants', [])
+        if 'value' in el
+    ]
+    postal_codes = [
+        el['postal_code'] for el in json.get('addresses', [])
+        if 'postal_code' in el
+    ]
+
+    input_values = _get_unique_values(chain(
+        ICN,
+        institution_acronyms,
+        institution_names,
+        [legacy_ICN],
+        name_variants,
+        postal_codes,
+    ))
+
+    json.update({
+        'affiliation_suggest': {
+            'input': input_values,
+            'output': legacy_ICN,
+            'payload': {
+                '$ref': json.get('self', {}).get('$ref'),
+                'ICN': ICN,
+                'institution_acronyms': institution_acronyms,
+                'institution_names': institution_names,
+                'legacy_ICN': legacy_ICN,
             },
-        })
+        },
+    })
 
 
 @before_record_index.connect
 def earliest_date(sender, json, *args, **kwargs):
     """Find and assign the earliest date to a HEP paper."""
-    date_paths = [
-        'preprint_date',
-        'thesis_info.date',
-        'thesis_info.defense_date',
-        'publication_info.year',
-        'legacy_creation_date',
-        'imprints.date',
-    ]
+    thesis_info = json.get('thesis_info', {})
 
-    dates = list(chain.from_iterable(
-        [force_list(get_value(json, path)) for path in date_paths]))
+    dates = [
+        json.get('preprint_date'),
+        thesis_info.get('date'),
+        thesis_info.get('defense_date'),
+        json.get('legacy_creation_date'),
+    ]
+    dates.extend(el.get('year') for el in json.get('publication_info', []))
+    dates.extend(el.get('date') for el in json.get('imprints', []))
+    dates = [date for date in dates if date]
 
     earliest_date = create_earliest_date(dates)
     if earliest_date:
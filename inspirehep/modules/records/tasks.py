@@ -36,13 +36,33 @@ from invenio_search import current_search_client as es
 
 from inspire_dojson.utils import get_recid_from_ref
 from inspirehep.modules.records.api import InspireRecord
-from inspirehep.modules.records.utils import get_endpoint_from_record
+from inspirehep.modules.records.utils import (
+    bulk_index,
+    create_index_op,
+    get_endpoint_from_record,
+)
 from inspirehep.utils.record_getter import get_db_record
 
 
 logger = get_task_logger(__name__)
 
 
+@shared_task(ignore_result=True)
+def index_records(uuids, delete_ops):
+    """Index the given records and apply the given delete actions.
+
+    Records are read back from the database, so that the revision indexed is
+    the latest one even if they were updated again after being queued.
+    """
+    index_ops = [
+        create_index_op(record) for record in InspireRecord.get_records(uuids)
+    ]
+    index_ops.extend(delete_ops)
+
+    if index_ops:
+        bulk_index(index_ops)
+
+
 @shared_task(ignore_result=True)
 def update_refs(old_ref, new_ref):
     """Update references in the entire database.
@@ -24,8 +24,13 @@
 
 from __future__ import absolute_import, division, print_function
 
+from elasticsearch.helpers import bulk as es_bulk
+from elasticsearch.helpers import parallel_bulk
 from flask import current_app
 
+from invenio_indexer.api import RecordIndexer, current_record_to_index
+from invenio_search import current_search, current_search_client as es
+
 from inspirehep.modules.pidstore.utils import (
     get_endpoint_from_pid_type,
     get_pid_type_from_schema
@@ -44,3 +49,61 @@ def get_detailed_template_from_record(record):
     """Return the detailed template corresponding to the given record."""
     endpoint = get_endpoint_from_record(record)
     return current_app.config['RECORDS_UI_ENDPOINTS'][endpoint]['template']
+
+
+def create_index_op(record):
+    """Return the ES bulk action indexing the given record."""
+    index, doc_type = current_record_to_index(record)
+
+    return {
+        '_op_type': 'index',
+        '_index': index,
+        '_type': doc_type,
+        '_id': str(record.id),
+        '_version': record.revision_id,
+        '_version_type': 'external_gte',
+        '_source': RecordIndexer._prepare_record(record, index, doc_type),
+    }
+
+
+def create_delete_op(model):
+    """Return the ES bulk action deleting the record of the given model.
+
+    Only the id and the schema of the record are needed, so it is read
+    straight from its ``RecordMetadata`` instead of being wrapped in a record.
+    """
+    index, doc_type = current_record_to_index(model.json)
+
+    return {
+        '_op_type': 'delete',
+        '_index': index,
+        '_type': doc_type,
+        '_id': str(model.id),
+    }
+
+
+def bulk_index(index_ops):
+    """Send the given bulk actions to Elasticsearch.
+
+    When ``INDEXER_BULK_THREAD_COUNT`` is greater than one the chunks are
+    sent concurrently from a pool of threads.
+    """
+    thread_count = current_app.config['INDEXER_BULK_THREAD_COUNT']
+    options = {
+        'chunk_size': current_app.config['INDEXER_BULK_CHUNK_SIZE'],
+        'request_timeout': current_app.config['INDEXER_BULK_REQUEST_TIMEOUT'],
+    }
+
+    if thread_count > 1:
+        # The worker threads have no application context, so they must be
+        # handed the client itself instead of the proxy to it.
+        results = parallel_bulk(
+            current_search.client,
+            index_ops,
+            thread_count=thread_count,
+            **options
+        )
+        for _ in results:
+            pass
+    else:
+        es_bulk(es, index_ops, stats_only=True, **options)
@@ -33,9 +33,15 @@ from functools import wraps
 
 import requests
 import six
+from elasticsearch_dsl import Q
 from flask import current_app
 from simplejson import JSONDecodeError
 
+from invenio_db import db
+from invenio_search import RecordsSearch
+from invenio_workflows import workflow_object_class
+from invenio_workflows.models import ObjectStatus, WorkflowObjectModel
+
 from inspire_utils.record import get_value
 from inspirehep.utils.datefilter import date_older_than
 from inspirehep.utils.record import get_arxiv_categories, get_arxiv_id
@@ -269,11 +275,6 @@ def previously_rejected(days_ago=None):
 @with_debug_logging
 def pending_in_holding_pen(obj, eng):
     """Check if a record exists in HP by looking in given KB."""
-    from elasticsearch_dsl import Q
-    from invenio_db import db
-    from invenio_search import RecordsSearch
-    from invenio_workflows.models import WorkflowObjectModel, ObjectStatus
-
     config = current_app.config['WORKFLOWS_UI_REST_ENDPOINT']
     index = config.get('search_index')
     doc_type = config.get('search_type')
@@ -319,7 +320,6 @@ def pending_in_holding_pen(obj, eng):
 @with_debug_logging
 def delete_self_and_stop_processing(obj, eng):
     """Delete both versions of itself and stops the workflow."""
-    from invenio_db import db
     db.session.delete(obj.model)
     eng.skip_token()
 
@@ -333,8 +333,6 @@ def stop_processing(obj, eng):
 @with_debug_logging
 def update_existing_workflow_object(obj, eng):
     """Update the data of the old object with the new data."""
-    from invenio_workflows import workflow_object_class
-
     holdingpen_ids = obj.extra_data.get("holdingpen_ids", [])
     for matched_id in holdingpen_ids:
         existing_obj = workflow_object_class.get(matched_id)
@@ -265,18 +265,18 @@ class Bibtex(Export):
     def _get_author(self):
         """Return list of name(s) of the author(s)."""
         def _is_supervisor(author):
-            contributor_roles = force_list(
-                get_value(author, 'contributor_roles.value'))
-            return 'Supervision' in contributor_roles
+            return any(
+                role.get('value') == 'Supervision'
+                for role in force_list(author.get('contributor_roles')))
 
         result = []
         spacinginitials = re.compile(r'([A-Z][a-z]{0,1}[}]?\.)(\b|[-\{])')
 
         authors = force_list(get_value(self.record, 'authors'))
-        non_supervisors = [el for el in authors if not _is_supervisor(el)]
         result.extend(
             [spacinginitials.sub(r'\1 \2', el['full_name'])
-                for el in non_supervisors if 'full_name' in el])
+                for el in authors
+                if 'full_name' in el and not _is_supervisor(el)])
 
         corporate_authors = force_list(
             get_value(self.record, 'corporate_author'))
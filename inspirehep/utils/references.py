@@ -28,6 +28,25 @@ from inspirehep.utils.jinja2 import render_template_to_string
 from inspirehep.utils.record_getter import get_es_records
 
 
+# ``raw_ref`` is not listed as it also needs the source of the references.
+REFEXTRACT_FIELDS_MAPPING = (
+    ('author', ReferenceBuilder.add_refextract_authors_str),
+    ('collaboration', ReferenceBuilder.add_collaboration),
+    ('doi', ReferenceBuilder.add_uid),
+    ('hdl', ReferenceBuilder.add_uid),
+    ('isbn', ReferenceBuilder.add_uid),
+    ('journal_reference', ReferenceBuilder.set_pubnote),
+    ('linemarker', ReferenceBuilder.set_label),
+    ('misc', ReferenceBuilder.add_misc),
+    ('publisher', ReferenceBuilder.set_publisher),
+    ('reportnumber', ReferenceBuilder.add_report_number),
+    ('texkey', ReferenceBuilder.set_texkey),
+    ('title', ReferenceBuilder.add_title),
+    ('url', ReferenceBuilder.add_url),
+    ('year', ReferenceBuilder.set_year),
+)
+
+
 class Reference(object):
     """Class used to output reference format in detailed record"""
 
@@ -73,9 +92,9 @@ class Reference(object):
                 ref_record = recid_to_reference.get(
                     reference.get('recid'), {}
                 )
-                if 'reference' in reference:
-                    reference.update(reference['reference'])
-                    del reference['reference']
+                # Work on a copy so that the record itself is left untouched.
+                reference = dict(reference)
+                reference.update(reference.pop('reference', {}))
                 if 'publication_info' in reference:
                     reference['publication_info'] = force_list(
                         reference['publication_info']
@@ -93,33 +112,26 @@ class Reference(object):
 
 def map_refextract_to_schema(extracted_references, source=None):
     """Convert refextract output to the schema using the builder."""
-    result = []
-
-    for reference in extracted_references:
-        rb = ReferenceBuilder()
-        mapping = [
-            ('author', rb.add_refextract_authors_str),
-            ('collaboration', rb.add_collaboration),
-            ('doi', rb.add_uid),
-            ('hdl', rb.add_uid),
-            ('isbn', rb.add_uid),
-            ('journal_reference', rb.set_pubnote),
-            ('linemarker', rb.set_label),
-            ('misc', rb.add_misc),
-            ('publisher', rb.set_publisher),
-            ('raw_ref', lambda raw_ref: rb.add_raw_reference(raw_ref, source=source)),
-            ('reportnumber', rb.add_report_number),
-            ('texkey', rb.set_texkey),
-            ('title', rb.add_title),
-            ('url', rb.add_url),
-            ('year', rb.set_year),
-        ]
-
-        for field, method in mapping:
-            for el in force_list(reference.get(field)):
-                if el:
-                    method(el)
-
-        result.append(rb.obj)
-
-    return result
+    return [
+        _map_refextract_reference(reference, source)
+        for reference in extracted_references
+    ]
+
+
+def _map_refextract_reference(reference, source):
+    rb = ReferenceBuilder()
+
+    for field, method in REFEXTRACT_FIELDS_MAPPING:
+        value = reference.get(field)
+        if not value:
+            continue
+
+        for el in force_list(value):
+            if el:
+                method(rb, el)
+
+    for raw_ref in force_list(reference.get('raw_ref')):
+        if raw_ref:
+            rb.add_raw_reference(raw_ref, source=source)
+
+    return rb.obj
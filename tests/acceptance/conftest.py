@@ -69,6 +69,14 @@ def app(request):
         yield app
 
 
+@pytest.fixture
+def capabilities(capabilities):
+    """Return control as soon as the DOM is ready when loading a page."""
+    capabilities['pageLoadStrategy'] = 'eager'
+
+    return capabilities
+
+
 @pytest.fixture
 def arsenic(selenium, app):
     Arsenic(selenium)
@@ -22,8 +22,17 @@
 
 from __future__ import absolute_import, division, print_function
 
+import uuid
+
+from flask import current_app
+from mock import patch
+
+from invenio_records.models import RecordMetadata
+
 from inspire_schemas.api import load_schema, validate
+from inspirehep.modules.records.experiments import EXPERIMENTS_MAP
 from inspirehep.modules.records.receivers import (
+    add_book_autocomplete,
     earliest_date,
     match_valid_experiments,
     populate_abstract_source_suggest,
@@ -31,6 +40,7 @@ from inspirehep.modules.records.receivers import (
     populate_inspire_document_type,
     populate_recid_from_ref,
     populate_title_suggest,
+    receive_after_model_commit,
 )
 
 
@@ -268,6 +278,11 @@ def test_match_valid_experiments_does_nothing_on_empty_list():
     assert json_dict['accelerator_experiments'] == []
 
 
+def test_experiments_map_keys_are_normalized():
+    for key in EXPERIMENTS_MAP:
+        assert key == key.lower().replace(' ', '')
+
+
 def test_populate_inspire_document_type_doc_type_from_refereed():
     json_dict = {
         'document_type': [
@@ -412,6 +427,16 @@ def test_populate_recid_from_ref_naming():
     assert json_dict['embedded_record']['recid'] == 5
 
 
+def test_populate_recid_from_ref_nested_lists():
+    json_dict = {
+        'nested_list': [[{'record': {'$ref': 'http://x/y/1'}}]],
+    }
+
+    populate_recid_from_ref(None, json_dict)
+
+    assert json_dict['nested_list'][0][0]['recid'] == 1
+
+
 def test_populate_recid_from_ref_deleted_records():
     json_dict = {
         'deleted_records': [{'$ref': 'http://x/y/1'},
@@ -606,6 +631,31 @@ def test_populate_title_suggest_without_full_title():
     assert expected == result
 
 
+def test_populate_title_suggest_drops_duplicate_and_empty_inputs():
+    record = {
+        '$schema': 'http://localhost:5000/schemas/records/journals.json',
+        'journal_title': {'title': 'JHEP'},
+        'short_title': 'JHEP',
+        'title_variants': [
+            'JOURNAL OF HIGH ENERGY PHYSICS',
+            '',
+            'JHEP',
+            'J HIGH ENERGY PHYS',
+        ],
+    }
+
+    populate_title_suggest(None, record)
+
+    expected = [
+        'JHEP',
+        'JOURNAL OF HIGH ENERGY PHYSICS',
+        'J HIGH ENERGY PHYS',
+    ]
+    result = record['title_suggest']['input']
+
+    assert expected == result
+
+
 def test_populate_title_suggest_does_nothing_if_record_is_not_journal():
     record = {'$schema': 'http://localhost:5000/schemas/records/other.json'}
 
@@ -668,7 +718,6 @@ def test_populate_affiliation_suggest_from_institution_hierarchy_acronym():
     expected = {
         'input': [
             'CERN',
-            'CERN',
         ],
         'output': 'CERN',
         'payload': {
@@ -859,3 +908,149 @@ def test_populate_affiliation_suggest_does_nothing_if_record_is_not_institution(
     populate_affiliation_suggest(None, record)
 
     assert 'affiliation_suggest' not in record
+
+
+def test_add_book_autocomplete_drops_duplicate_and_empty_inputs():
+    record = {
+        'document_type': ['book'],
+        'authors': [
+            {'full_name': 'Smith, John'},
+            {'full_name': ''},
+            {'full_name': 'Doe, Jane'},
+        ],
+        'titles': [
+            {'title': 'Smith, John'},
+            {'title': 'A Book'},
+        ],
+        'self': {'$ref': 'http://localhost:5000/api/literature/1'},
+    }
+
+    add_book_autocomplete(None, record)
+
+    expected = {
+        'input': [
+            'Smith, John',
+            'Doe, Jane',
+            'A Book',
+        ],
+        'payload': {
+            'authors': ['Smith, John', '', 'Doe, Jane'],
+            'id': 'http://localhost:5000/api/literature/1',
+            'title': ['Smith, John', 'A Book'],
+        },
+    }
+    result = record['bookautocomplete']
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.records.utils.es_bulk')
+def test_receive_after_model_commit_indexes_inserted_and_updated_records(es_bulk):
+    inserted = RecordMetadata(
+        id=uuid.uuid4(),
+        json={
+            '$schema': 'http://localhost:5000/schemas/records/journals.json',
+            'short_title': 'JHEP',
+        },
+        version_id=1,
+    )
+    updated = RecordMetadata(
+        id=uuid.uuid4(),
+        json={
+            '$schema': 'http://localhost:5000/schemas/records/journals.json',
+            'short_title': 'JCAP',
+        },
+        version_id=3,
+    )
+
+    receive_after_model_commit(None, [(inserted, 'insert'), (updated, 'update')])
+
+    assert es_bulk.call_count == 1
+
+    index_ops = es_bulk.call_args[0][1]
+
+    assert [(op['_op_type'], op['_index'], op['_type']) for op in index_ops] == [
+        ('index', 'records-journals', 'journals'),
+        ('index', 'records-journals', 'journals'),
+    ]
+    assert [op['_id'] for op in index_ops] == [str(inserted.id), str(updated.id)]
+    assert [op['_version'] for op in index_ops] == [0, 2]
+    assert [op['_version_type'] for op in index_ops] == ['external_gte', 'external_gte']
+    assert [op['_source']['short_title'] for op in index_ops] == ['JHEP', 'JCAP']
+
+
+@patch('inspirehep.modules.records.utils.es_bulk')
+def test_receive_after_model_commit_deletes_deleted_records(es_bulk):
+    deleted = RecordMetadata(
+        id=uuid.uuid4(),
+        json={'$schema': 'http://localhost:5000/schemas/records/hep.json'},
+    )
+
+    receive_after_model_commit(None, [(deleted, 'delete')])
+
+    expected = [
+        {
+            '_op_type': 'delete',
+            '_index': 'records-hep',
+            '_type': 'hep',
+            '_id': str(deleted.id),
+        },
+    ]
+    result = es_bulk.call_args[0][1]
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.records.utils.es_bulk')
+def test_receive_after_model_commit_ignores_other_models(es_bulk):
+    deleted = RecordMetadata(
+        id=uuid.uuid4(),
+        json={'$schema': 'http://localhost:5000/schemas/records/hep.json'},
+    )
+
+    receive_after_model_commit(None, [(object(), 'insert'), (deleted, 'delete')])
+
+    result = es_bulk.call_args[0][1]
+
+    assert [op['_id'] for op in result] == [str(deleted.id)]
+
+
+@patch('inspirehep.modules.records.utils.es_bulk')
+def test_receive_after_model_commit_does_nothing_without_records(es_bulk):
+    receive_after_model_commit(None, [])
+    receive_after_model_commit(None, [(object(), 'update')])
+
+    assert not es_bulk.called
+
+
+@patch('inspirehep.modules.records.utils.es_bulk')
+@patch('inspirehep.modules.records.receivers.index_records')
+def test_receive_after_model_commit_queues_records_when_async(index_records, es_bulk):
+    updated = RecordMetadata(
+        id=uuid.uuid4(),
+        json={'$schema': 'http://localhost:5000/schemas/records/hep.json'},
+        version_id=2,
+    )
+    deleted = RecordMetadata(
+        id=uuid.uuid4(),
+        json={'$schema': 'http://localhost:5000/schemas/records/hep.json'},
+    )
+    config = {
+        'INDEXER_BULK_ASYNC': True,
+    }
+
+    with patch.dict(current_app.config, config):
+        receive_after_model_commit(None, [(updated, 'update'), (deleted, 'delete')])
+
+    index_records.delay.assert_called_with(
+        [str(updated.id)],
+        [
+            {
+                '_op_type': 'delete',
+                '_index': 'records-hep',
+                '_type': 'hep',
+                '_id': str(deleted.id),
+            },
+        ],
+    )
+    assert not es_bulk.called
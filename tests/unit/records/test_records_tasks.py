@@ -22,10 +22,15 @@
 
 from __future__ import absolute_import, division, print_function
 
+import uuid
+
 from flask import current_app
 from mock import patch
 
-from inspirehep.modules.records.tasks import update_links
+from invenio_records.models import RecordMetadata
+
+from inspirehep.modules.records.api import InspireRecord
+from inspirehep.modules.records.tasks import index_records, update_links
 
 
 def test_update_links():
@@ -146,3 +151,37 @@ def test_update_links_ignores_non_whitelisted_paths():
                 'record': {'$ref': 'http://localhost:5000/record/1'},
             }
         }
+
+
+@patch('inspirehep.modules.records.tasks.bulk_index')
+@patch('inspirehep.modules.records.tasks.InspireRecord.get_records')
+def test_index_records(get_records, bulk_index):
+    model = RecordMetadata(
+        id=uuid.uuid4(),
+        json={
+            '$schema': 'http://localhost:5000/schemas/records/journals.json',
+            'short_title': 'JHEP',
+        },
+        version_id=2,
+    )
+    get_records.return_value = [InspireRecord(model.json, model)]
+
+    delete_op = {
+        '_op_type': 'delete',
+        '_index': 'records-hep',
+        '_type': 'hep',
+        '_id': str(uuid.uuid4()),
+    }
+
+    index_records([str(model.id)], [delete_op])
+
+    get_records.assert_called_with([str(model.id)])
+    assert bulk_index.call_count == 1
+
+    index_op, result_delete_op = bulk_index.call_args[0][0]
+
+    assert index_op['_op_type'] == 'index'
+    assert index_op['_id'] == str(model.id)
+    assert index_op['_version'] == 1
+    assert index_op['_source']['short_title'] == 'JHEP'
+    assert result_delete_op == delete_op
@@ -22,7 +22,19 @@
 
 from __future__ import absolute_import, division, print_function
 
-from inspirehep.modules.records.utils import get_endpoint_from_record
+import uuid
+
+from flask import current_app
+from mock import patch
+
+from invenio_records.models import RecordMetadata
+from invenio_search import current_search
+
+from inspirehep.modules.records.utils import (
+    bulk_index,
+    create_delete_op,
+    get_endpoint_from_record,
+)
 
 
 def test_get_endpoint_from_record():
@@ -43,3 +55,46 @@ def test_get_endpoint_from_record_supports_relative_urls():
     result = get_endpoint_from_record(record)
 
     assert expected == result
+
+
+def test_create_delete_op():
+    record_id = uuid.uuid4()
+    model = RecordMetadata(
+        id=record_id,
+        json={'$schema': 'http://localhost:5000/schemas/records/hep.json'},
+    )
+
+    expected = {
+        '_op_type': 'delete',
+        '_index': 'records-hep',
+        '_type': 'hep',
+        '_id': str(record_id),
+    }
+    result = create_delete_op(model)
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.records.utils.es_bulk')
+@patch('inspirehep.modules.records.utils.parallel_bulk')
+def test_bulk_index_sends_chunks_in_parallel(parallel_bulk, es_bulk):
+    results = iter([(True, {}), (True, {})])
+    parallel_bulk.return_value = results
+
+    index_ops = [
+        {'_op_type': 'delete', '_index': 'records-hep', '_type': 'hep', '_id': '1'},
+    ]
+    config = {
+        'INDEXER_BULK_THREAD_COUNT': 4,
+    }
+
+    with patch.dict(current_app.config, config):
+        bulk_index(index_ops)
+
+    args, kwargs = parallel_bulk.call_args
+
+    assert args[0] is current_search.client
+    assert args[1] == index_ops
+    assert kwargs['thread_count'] == 4
+    assert list(results) == []
+    assert not es_bulk.called